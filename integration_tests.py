@@ -20,69 +20,215 @@ Options:
 """
 
 import asyncio
-import json
 import os
 import sys
 import time
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import aiohttp
+import orjson
 import requests
-from urllib.parse import urljoin
+import yarl
 import argparse
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# Cap on in-flight requests and per-request timeout, so one slow or hung endpoint
+# fails fast instead of hiding the results of the tests running alongside it
+MAX_CONCURRENT_REQUESTS = 16
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=2)
+
+# Session shared by every IntegrationTester in the process, so repeated or sharded
+# runs reuse pooled connections instead of reconnecting per instance. The semaphore
+# is created with it so MAX_CONCURRENT_REQUESTS caps requests across all testers.
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_SHARED_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+# Routes swept by test_api_routes as (method, endpoint, JSON body). Bodies are
+# serialized once here and sent as raw bytes rather than re-encoded per request.
+ROUTES: Tuple[Tuple[str, str, Optional[bytes]], ...] = (
+    ('GET', '/health', None),
+    ('GET', '/users', None),
+    ('GET', '/jobs', None),
+    ('GET', '/candidates', None),
+    ('GET', '/recruiters', None),
+    ('POST', '/ranking', orjson.dumps({"user_skills": ["python", "react"], "job_skills": ["python", "django"]})),  # Requires POST with payload
+    ('GET', '/resumes/test_user', None),  # Requires user_id parameter
+    ('POST', '/api/scrape-jobs', orjson.dumps({"platform": "indeed", "keyword": "software engineer", "location": "remote"})),  # May not work in Docker environment
+)
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Field prefixes a server-sent events stream can start with
+SSE_FIELD_PREFIXES = ('data:', 'event:', 'id:', 'retry:', ':')
+
+# Per-endpoint success checks for test_api_routes, applied after the generic
+# FastAPI error check. Endpoints not listed here only need to avoid an error.
+ROUTE_VALIDATORS: Dict[str, Callable[[Any], bool]] = {
+    # Health endpoint should have specific structure
+    '/health': lambda response: 'status' in response and 'message' in response,
+    # Users endpoint returns 'users' key
+    '/users': lambda response: 'users' in response,
+    # Data endpoints should have items array
+    '/jobs': lambda response: 'items' in response,
+    '/candidates': lambda response: 'items' in response,
+    '/recruiters': lambda response: 'items' in response,
+    # Resume endpoint should return data
+    '/resumes/test_user': lambda response: isinstance(response, (list, dict)),
+    # Ranking endpoint should have match_score
+    '/ranking': lambda response: 'match_score' in response,
+}
+
+def _accept_response(response: Any) -> bool:
+    """Default validator for routes without a specific response shape"""
+    return True
+
+class TestRequestError(Exception):
+    """Raised when a request cannot be completed (connection failure, timeout, bad body)"""
 
 class IntegrationTester:
+    """Runs the integration suite against a backend.
+
+    All instances share one ClientSession (see get_session). Exiting the context
+    manager does not close it; call IntegrationTester.close_session() once before
+    the event loop shuts down, or aiohttp warns about an unclosed client session.
+    """
+
     def __init__(self, base_url: str = "http://backend:8000", verbose: bool = False):
         self.base_url = base_url
+        self._base = yarl.URL(base_url)
+        # Resolved URLs per endpoint; the suite only uses a fixed set of endpoint strings
+        self._url_cache: Dict[str, yarl.URL] = {}
         self.verbose = verbose
         self.session: Optional[aiohttp.ClientSession] = None
         self.test_results = []
+        self._auth_header: Dict[str, str] = {}
         self.auth_token = None
 
+    @property
+    def auth_token(self) -> Optional[str]:
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, token: Optional[str]):
+        """Set the bearer token and build its Authorization header once"""
+        self._auth_token = token
+        self._auth_header = {'Authorization': f'Bearer {token}'} if token else {}
+
+    @classmethod
+    async def get_session(cls) -> aiohttp.ClientSession:
+        """Return the shared session, creating it (and the shared request semaphore) if needed"""
+        global _SHARED_SESSION, _SHARED_SEMAPHORE
+        if _SHARED_SESSION is None or _SHARED_SESSION.closed:
+            # Tests fan out concurrently against a single backend host, so size the pool
+            # for that host, cache DNS and keep sockets alive between test groups
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            _SHARED_SESSION = aiohttp.ClientSession(
+                connector=connector,
+                timeout=REQUEST_TIMEOUT
+            )
+            _SHARED_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return _SHARED_SESSION
+
+    @classmethod
+    async def close_session(cls):
+        """Close the shared session; call once before the event loop shuts down"""
+        global _SHARED_SESSION, _SHARED_SEMAPHORE
+        if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
+            await _SHARED_SESSION.close()
+        _SHARED_SESSION = None
+        _SHARED_SEMAPHORE = None
+
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = await self.get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        """Leave the shared session open for other testers; it is only closed by
+        close_session(), which callers outside main() must await themselves"""
+        pass
 
     def log(self, message: str):
         """Log message if verbose mode is enabled"""
         if self.verbose:
             print(f"[LOG] {message}")
 
-    def record_test_result(self, test_name: str, success: bool, message: str = ""):
-        """Record a test result"""
+    def record_test_result(self, test_name: str, success: bool, message: str = "",
+                           details: Optional[List[Dict[str, Any]]] = None):
+        """Record a test result, with optional per-check details for the JSON report"""
         result = {
             "test": test_name,
             "success": success,
             "message": message,
             "timestamp": time.time()
         }
+        if details is not None:
+            result["details"] = details
         self.test_results.append(result)
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}")
-        if message:
-            print(f"   {message}")
-
-    async def make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make an HTTP request with proper error handling"""
-        url = urljoin(self.base_url, endpoint)
-        headers = kwargs.get('headers', {})
-
-        if self.auth_token and 'Authorization' not in headers:
-            headers['Authorization'] = f'Bearer {self.auth_token}'
-
-        kwargs['headers'] = headers
+        # Single write per result so concurrent tests cannot interleave their lines
+        sys.stdout.write(f"{status} {test_name}\n" + (f"   {message}\n" if message else ""))
+
+    def _prepare_request(self, endpoint: str, kwargs: Dict[str, Any]) -> yarl.URL:
+        """Resolve the request URL (cached per endpoint) and add the auth header to the request kwargs"""
+        if self._auth_header:
+            # Explicit headers (including Authorization) take precedence over the cached token
+            kwargs['headers'] = {**self._auth_header, **kwargs.get('headers', {})}
+
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self._base.join(yarl.URL(endpoint))
+        return url
+
+    @asynccontextmanager
+    async def _request(self, method: str, endpoint: str, **kwargs):
+        """Send a request within the concurrency cap, yielding the response and the time
+        the request started (after queueing for a slot). Any failure while sending or
+        reading the response is raised as TestRequestError."""
+        url = self._prepare_request(endpoint, kwargs)
 
         try:
-            async with self.session.request(method, url, **kwargs) as response:
-                if response.content_type == 'application/json':
-                    return await response.json()
-                else:
-                    return {"text": await response.text(), "status": response.status}
+            async with _SHARED_SEMAPHORE:
+                start = time.perf_counter()
+                async with self.session.request(method, url, **kwargs) as response:
+                    yield response, start
+        except asyncio.TimeoutError as e:
+            raise TestRequestError(
+                f"{method} {endpoint} timed out "
+                f"(limits: {REQUEST_TIMEOUT.total}s total, {REQUEST_TIMEOUT.connect}s connect)"
+            ) from e
         except Exception as e:
-            return {"error": str(e), "status": 0}
+            raise TestRequestError(f"{method} {endpoint} failed: {e}") from e
+
+    async def make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request, raising TestRequestError if it cannot be completed"""
+        async with self._request(method, endpoint, **kwargs) as (response, _):
+            body = await response.read()
+            if response.content_type == 'application/json':
+                return orjson.loads(body)
+            else:
+                return {"text": body.decode(response.charset or 'utf-8', errors='ignore'), "status": response.status}
+
+    async def make_streaming_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request, reading only the first chunk of the response body.
+
+        Raises TestRequestError if the request cannot be completed.
+        """
+        async with self._request(method, endpoint, **kwargs) as (response, start):
+            first_chunk = b''
+            async for chunk in response.content.iter_chunked(4096):
+                first_chunk = chunk
+                break
+            return {
+                "status": response.status,
+                "first_chunk": first_chunk[:256].decode(errors='ignore'),
+                "ttfb": time.perf_counter() - start
+            }
 
     async def test_health_endpoint(self) -> bool:
         """Test the health endpoint"""
@@ -123,106 +269,70 @@ class IntegrationTester:
         """Test dummy data loading from database"""
         self.log("Testing data loading...")
 
-        # Test jobs endpoint
-        response = await self.make_request('GET', '/jobs')
+        # Jobs, candidates and recruiters are independent, so fetch them concurrently
+        jobs, candidates, recruiters = await asyncio.gather(
+            self.make_request('GET', '/jobs'),
+            self.make_request('GET', '/candidates'),
+            self.make_request('GET', '/recruiters'),
+            return_exceptions=True
+        )
 
-        if 'items' in response and isinstance(response['items'], list):
-            job_count = len(response['items'])
-            self.record_test_result("Data Loading - Jobs", True, f"Loaded {job_count} jobs from database")
-        else:
-            self.record_test_result("Data Loading - Jobs", False, f"Failed to load jobs: {response}")
-            return False
+        resources = (("jobs", jobs), ("candidates", candidates), ("recruiters", recruiters))
 
-        # Test candidates endpoint
-        response = await self.make_request('GET', '/candidates')
-
-        if 'items' in response and isinstance(response['items'], list):
-            candidate_count = len(response['items'])
-            self.record_test_result("Data Loading - Candidates", True, f"Loaded {candidate_count} candidates from database")
-        else:
-            self.record_test_result("Data Loading - Candidates", False, f"Failed to load candidates: {response}")
-            return False
-
-        # Test recruiters endpoint
-        response = await self.make_request('GET', '/recruiters')
+        details = []
+        for noun, response in resources:
+            if not isinstance(response, Exception) and 'items' in response and isinstance(response['items'], list):
+                details.append({"check": noun, "success": True, "message": f"Loaded {len(response['items'])} {noun}"})
+            else:
+                details.append({"check": noun, "success": False, "message": f"Failed to load {noun}: {response}"})
 
-        if 'items' in response and isinstance(response['items'], list):
-            recruiter_count = len(response['items'])
-            self.record_test_result("Data Loading - Recruiters", True, f"Loaded {recruiter_count} recruiters from database")
+        # Record one result for the group; per-resource outcomes go to the JSON report only
+        success = all(detail["success"] for detail in details)
+        if success:
+            counts = ", ".join(f"{len(response['items'])} {noun}" for noun, response in resources)
+            summary = f"Loaded {counts} from database"
         else:
-            self.record_test_result("Data Loading - Recruiters", False, f"Failed to load recruiters: {response}")
-            return False
-
-        return True
+            summary = "; ".join(detail["message"] for detail in details if not detail["success"])
+        self.record_test_result("Data Loading", success, summary, details)
+        return success
 
     async def test_api_routes(self) -> bool:
         """Test all major API routes"""
         self.log("Testing API routes...")
 
-        routes_to_test = [
-            ('GET', '/health'),
-            ('GET', '/users'),
-            ('GET', '/jobs'),
-            ('GET', '/candidates'),
-            ('GET', '/recruiters'),
-            ('POST', '/ranking', {"user_skills": ["python", "react"], "job_skills": ["python", "django"]}),  # Requires POST with payload
-            ('GET', '/resumes/test_user'),  # Requires user_id parameter
-            ('POST', '/api/scrape-jobs', {"platform": "indeed", "keyword": "software engineer", "location": "remote"}),  # May not work in Docker environment
-        ]
-
-        success_count = 0
-
-        for route_spec in routes_to_test:
-            if len(route_spec) == 2:
-                method, endpoint = route_spec
-                payload = None
-            else:
-                method, endpoint, payload = route_spec
-
-            if method == 'POST' and payload:
-                response = await self.make_request(method, endpoint, json=payload)
-            else:
-                response = await self.make_request(method, endpoint)
+        # Routes are independent, so issue all requests concurrently over the pooled session
+        responses = await asyncio.gather(*(
+            self.make_request(method, endpoint, data=payload, headers=JSON_HEADERS)
+            if payload is not None else self.make_request(method, endpoint)
+            for method, endpoint, payload in ROUTES
+        ), return_exceptions=True)
 
+        details = []
+        for (method, endpoint, payload), response in zip(ROUTES, responses):
             # Check if the response indicates success
             # API returns data directly, check for absence of FastAPI error indicators
-            is_success = True
-            if 'detail' in response:
-                # FastAPI error response
-                is_success = False
-            elif 'error' in response:
-                # Generic error
-                is_success = False
-            elif endpoint == '/health' and ('status' not in response or 'message' not in response):
-                # Health endpoint should have specific structure
-                is_success = False
-            elif endpoint in ['/jobs', '/candidates', '/recruiters', '/users'] and 'items' not in response and endpoint != '/users':
-                # Data endpoints should have items array (except /users which returns 'users')
+            if isinstance(response, Exception) or 'detail' in response or 'error' in response:
                 is_success = False
-            elif endpoint == '/users' and 'users' not in response:
-                # Users endpoint returns 'users' key
-                is_success = False
-            elif endpoint == '/resumes/test_user' and not isinstance(response, (list, dict)):
-                # Resume endpoint should return data
-                is_success = False
-            elif endpoint == '/ranking' and 'match_score' not in response:
-                # Ranking endpoint should have match_score
-                is_success = False
-            elif endpoint == '/api/scrape-jobs' and 'detail' in response and response.get('detail') == 'Not Found':
-                # Scrape jobs may not be available in Docker environment
-                is_success = True  # Consider this acceptable
-
-            if is_success:
-                success_count += 1
-                self.record_test_result(f"API Route - {method} {endpoint}", True, f"Route accessible - returned data")
             else:
-                self.record_test_result(f"API Route - {method} {endpoint}", False, f"Route failed: {response}")
-
-        if success_count == len(routes_to_test):
-            self.record_test_result("API Routes Overall", True, f"All {success_count} routes working")
+                is_success = ROUTE_VALIDATORS.get(endpoint, _accept_response)(response)
+
+            details.append({
+                "check": f"{method} {endpoint}",
+                "success": is_success,
+                "message": "Route accessible - returned data" if is_success else f"Route failed: {response}"
+            })
+
+        # Record one result for the sweep; per-route outcomes go to the JSON report only
+        failed = [detail["check"] for detail in details if not detail["success"]]
+        if not failed:
+            self.record_test_result("API Routes", True, f"All {len(details)} routes working", details)
             return True
         else:
-            self.record_test_result("API Routes Overall", False, f"Only {success_count}/{len(routes_to_test)} routes working")
+            self.record_test_result(
+                "API Routes", False,
+                f"Only {len(details) - len(failed)}/{len(details)} routes working; failed: {', '.join(failed)}",
+                details
+            )
             return False
 
     async def test_file_upload(self) -> bool:
@@ -250,16 +360,25 @@ class IntegrationTester:
             "job_id": "test_job"
         }
 
-        response = await self.make_request('POST', '/recruiter-workflow/generate-stream', json=test_payload)
+        # Only the first chunk is read, so the stream is never buffered in full
+        response = await self.make_streaming_request('POST', '/recruiter-workflow/generate-stream', json=test_payload)
 
         # Check if streaming endpoint is available (may return 400 for invalid data but endpoint exists)
-        if 'detail' not in response or response.get('detail') != 'Not Found':
-            self.record_test_result("AI Streaming", True, "AI streaming endpoint accessible")
-            return True
-        else:
+        if response['status'] == 404:
             self.record_test_result("AI Streaming", False, f"AI streaming failed: {response}")
             return False
 
+        # A successful response must start streaming SSE-framed events
+        if 200 <= response['status'] < 300 and not response['first_chunk'].lstrip().startswith(SSE_FIELD_PREFIXES):
+            self.record_test_result("AI Streaming", False, f"AI streaming returned an unframed first chunk: {response}")
+            return False
+
+        self.record_test_result(
+            "AI Streaming", True,
+            f"AI streaming endpoint accessible (first chunk after {response['ttfb'] * 1000:.0f}ms)"
+        )
+        return True
+
     async def test_admin_llm_settings(self) -> bool:
         """Test admin LLM settings availability"""
         self.log("Testing admin LLM settings...")
@@ -290,6 +409,14 @@ class IntegrationTester:
             self.record_test_result("Prompts Management", False, f"Prompts management failed: {response}")
             return False
 
+    async def _run_one(self, test_name: str, test_func) -> bool:
+        """Run a single test, recording a failure under its name if it raises"""
+        try:
+            return bool(await test_func())
+        except Exception as e:
+            self.record_test_result(test_name, False, f"Exception: {str(e)}")
+            return False
+
     async def run_all_tests(self) -> Dict[str, Any]:
         """Run all integration tests"""
         print("🚀 Starting AI Job Hunter Integration Tests")
@@ -307,16 +434,26 @@ class IntegrationTester:
             ("Prompts Management", self.test_prompts_management),
         ]
 
-        passed = 0
         total = len(tests)
 
-        for test_name, test_func in tests:
-            try:
-                result = await test_func()
-                if result:
-                    passed += 1
-            except Exception as e:
-                self.record_test_result(test_name, False, f"Exception: {str(e)}")
+        # Warm the connection pool (DNS cache + a keep-alive socket) before fanning out;
+        # the result is ignored since the health test checks it properly
+        try:
+            await self.make_request('GET', '/health')
+        except TestRequestError:
+            pass
+
+        # Tests hit independent endpoints, so run them concurrently
+        results = await asyncio.gather(
+            *(self._run_one(name, func) for name, func in tests),
+            return_exceptions=True
+        )
+        passed = sum(1 for result in results if result is True)
+
+        # Tests finish in any order; each records its result under its declared name,
+        # so restore the declared order (the sort is stable for any other results)
+        order = {name: index for index, (name, _) in enumerate(tests)}
+        self.test_results.sort(key=lambda result: order.get(result["test"], total))
 
         # Summary
         print("\n" + "=" * 50)
@@ -348,17 +485,27 @@ async def main():
         print("Using MongoDB Atlas configuration")
         # In a real scenario, you might set environment variables here
 
-    async with IntegrationTester(args.url, args.verbose) as tester:
-        results = await tester.run_all_tests()
+    try:
+        async with IntegrationTester(args.url, args.verbose) as tester:
+            results = await tester.run_all_tests()
 
-        # Save results to file
-        with open('integration_test_results.json', 'w') as f:
-            json.dump(results, f, indent=2)
+            # Save results to file
+            Path('integration_test_results.json').write_bytes(
+                orjson.dumps(results, option=orjson.OPT_INDENT_2)
+            )
 
-        print(f"\n📄 Detailed results saved to integration_test_results.json")
+            print(f"\n📄 Detailed results saved to integration_test_results.json")
 
-        # Exit with appropriate code
-        sys.exit(0 if results['failed_tests'] == 0 else 1)
+            # Exit with appropriate code
+            sys.exit(0 if results['failed_tests'] == 0 else 1)
+    finally:
+        await IntegrationTester.close_session()
 
 if __name__ == "__main__":
+    # The suite is pure asyncio HTTP I/O, so use uvloop's faster event loop when available
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-import requests
-import json
+import asyncio
+import aiohttp
 
 # Test data for recruiter workflow
 test_payload = {
@@ -24,24 +24,48 @@ test_payload = {
     }
 }
 
-# Make the request
+# Payloads to send; add more to exercise the workflow concurrently
+payloads = [test_payload]
+
 url = "http://localhost:8010/recruiter-workflow/generate"
 headers = {"Content-Type": "application/json"}
 
+
+async def post_workflow(session, payload):
+    """POST a single payload and return the status code with the parsed body"""
+    async with session.post(url, json=payload, headers=headers) as response:
+        if response.status == 200:
+            # Parse regardless of Content-Type, as requests' .json() did
+            return response.status, await response.json(content_type=None)
+        return response.status, await response.text()
+
+
+async def run(payloads):
+    """Send all payloads concurrently over one pooled session; a failed request is
+    returned as its exception so it does not discard the other results"""
+    connector = aiohttp.TCPConnector(limit=20)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(*(post_workflow(session, p) for p in payloads), return_exceptions=True)
+
+
 print("Making request to recruiter workflow...")
-response = requests.post(url, json=test_payload, headers=headers)
-
-print(f"Status Code: {response.status_code}")
-if response.status_code == 200:
-    result = response.json()
-    print("Success! Response received.")
-    print("Keys in response:", list(result.keys()))
-    # Check if engagement_plan exists and what type it is
-    if "engagement_plan" in result:
-        print(f"engagement_plan type: {type(result['engagement_plan'])}")
-        print(f"engagement_plan value: {result['engagement_plan']}")
-    if "fairness_guidance" in result:
-        print(f"fairness_guidance type: {type(result['fairness_guidance'])}")
-        print(f"fairness_guidance value: {result['fairness_guidance']}")
-else:
-    print(f"Error: {response.text}")
\ No newline at end of file
+for outcome in asyncio.run(run(payloads)):
+    if isinstance(outcome, Exception):
+        print(f"Error: {type(outcome).__name__}: {outcome}")
+        continue
+
+    status_code, result = outcome
+    print(f"Status Code: {status_code}")
+    if status_code == 200:
+        print("Success! Response received.")
+        print("Keys in response:", list(result.keys()))
+        # Check if engagement_plan exists and what type it is
+        if "engagement_plan" in result:
+            print(f"engagement_plan type: {type(result['engagement_plan'])}")
+            print(f"engagement_plan value: {result['engagement_plan']}")
+        if "fairness_guidance" in result:
+            print(f"fairness_guidance type: {type(result['fairness_guidance'])}")
+            print(f"fairness_guidance value: {result['fairness_guidance']}")
+    else:
+        print(f"Error: {result}")